@@ -12,11 +12,8 @@ DEFAULT_SWAGGER_SETTINGS = {
 
 try:
     from django.conf import settings
-    SWAGGER_SETTINGS = getattr(settings, 'SWAGGER_SETTINGS', DEFAULT_SWAGGER_SETTINGS)
-
-    for key, value in DEFAULT_SWAGGER_SETTINGS.items():
-        if key not in SWAGGER_SETTINGS:
-            SWAGGER_SETTINGS[key] = value
+    SWAGGER_SETTINGS = DEFAULT_SWAGGER_SETTINGS.copy()
+    SWAGGER_SETTINGS.update(getattr(settings, 'SWAGGER_SETTINGS', {}))
 
 except:
     SWAGGER_SETTINGS = DEFAULT_SWAGGER_SETTINGS
@@ -1,8 +1,11 @@
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework_swagger import SWAGGER_SETTINGS
 
 class APIDocView(APIView):
+    # Swagger UI only consumes JSON
+    renderer_classes = (JSONRenderer,)
 
     def initial(self, request, *args, **kwargs):
         self.permission_classes = (self.get_permission_class(request),)
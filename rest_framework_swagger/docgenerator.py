@@ -7,7 +7,13 @@ from .introspectors import APIViewIntrospector, \
     ViewSetIntrospector, BaseMethodIntrospector, IntrospectorHelper
 
 
+# Placeholder request made available to views while they are introspected
+_dummy_request = HttpRequest()
+
+
 class DocumentationGenerator(object):
+    __slots__ = ()
+
     def generate(self, apis):
         """
         Returns documentaion for a list of APIs
@@ -30,7 +36,7 @@ class DocumentationGenerator(object):
         path = api['path']
         pattern = api['pattern']
         callback = api['callback']
-        callback.request = HttpRequest()
+        callback.request = _dummy_request
 
         if issubclass(callback, viewsets.ViewSetMixin):
             introspector = ViewSetIntrospector(callback, path, pattern)
@@ -38,15 +44,18 @@ class DocumentationGenerator(object):
             introspector = APIViewIntrospector(callback, path, pattern)
 
         for method_introspector in introspector:
-            if not isinstance(method_introspector, BaseMethodIntrospector) or \
-                    method_introspector.get_http_method() == "OPTIONS":
+            if not isinstance(method_introspector, BaseMethodIntrospector):
+                continue
+
+            http_method = method_introspector.get_http_method()
+            if http_method == "OPTIONS":
                 continue  # No one cares. I impose JSON.
 
             serializer = method_introspector.get_serializer_class()
             serializer_name = IntrospectorHelper.get_serializer_name(serializer)
 
             operation = {
-                'httpMethod': method_introspector.get_http_method(),
+                'httpMethod': http_method,
                 'summary': method_introspector.get_summary(),
                 'nickname': method_introspector.get_nickname(),
                 'notes': method_introspector.get_notes(),
@@ -86,9 +95,15 @@ class DocumentationGenerator(object):
         of APIs
         """
         serializers = set()
+        callbacks = set()
 
         for api in apis:
-            serializer = self._get_serializer_class(api['callback'])
+            callback = api['callback']
+            if callback in callbacks:
+                continue
+            callbacks.add(callback)
+
+            serializer = self._get_serializer_class(callback)
             if serializer is not None:
                 serializers.add(serializer)
 
@@ -101,7 +116,7 @@ class DocumentationGenerator(object):
         if serializer is None:
             return
 
-        fields = serializer().get_fields()
+        fields = IntrospectorHelper.get_serializer_fields(serializer)
 
         data = {}
         for name, field in fields.items():
@@ -109,15 +124,25 @@ class DocumentationGenerator(object):
             data[name] = {
                 'type': field.type_label,
                 'required': getattr(field, 'required', None),
-                'allowableValues': {
-                    'min': getattr(field, 'min_length', None),
-                    'max': getattr(field, 'max_length', None),
-                    'defaultValue': getattr(field, 'default', None),
-                    'readOnly': getattr(field, 'read_only', None),
-                    'valueType': 'RANGE',
-                }
             }
 
+            allowable_values = {}
+            min_length = getattr(field, 'min_length', None)
+            if min_length is not None:
+                allowable_values['min'] = min_length
+            max_length = getattr(field, 'max_length', None)
+            if max_length is not None:
+                allowable_values['max'] = max_length
+            default = getattr(field, 'default', None)
+            if default is not None:
+                allowable_values['defaultValue'] = default
+            if getattr(field, 'read_only', False):
+                allowable_values['readOnly'] = True
+
+            if allowable_values:
+                allowable_values['valueType'] = 'RANGE'
+                data[name]['allowableValues'] = allowable_values
+
         return data
 
     def _get_serializer_class(self, callback):
@@ -7,6 +7,33 @@ from django.contrib.admindocs.utils import trim_docstring
 from rest_framework.views import get_view_name, get_view_description
 
 
+# Serializer fields keyed by serializer class. Building the fields is the
+# expensive part of DRF introspection and the same serializer is usually
+# shared by many endpoints.
+_serializer_fields_cache = {}
+
+# Stripped docstrings keyed by the raw docstring. Views without method
+# docstrings share the class docstring across all of their methods.
+_stripped_docstring_cache = {}
+
+# Short view descriptions keyed by view class
+_view_description_cache = {}
+
+_path_param_re = re.compile(r'/{([^}]*)}')
+
+# Query parameters are documented as "name -- description" lines
+_query_param_re = re.compile(r'^(.*?) -- (.*)$', re.MULTILINE)
+
+# The first line documenting a parameter ends the docstring body
+_param_line_re = re.compile(r'^.*--', re.MULTILINE)
+
+# HTTP methods that do not take a request body
+_bodyless_methods = frozenset(['GET', 'DELETE'])
+
+# Marks lazily computed attributes for which None is a valid value
+_unset = object()
+
+
 class IntrospectorHelper(object):
     __metaclass__ = ABCMeta
 
@@ -16,18 +43,23 @@ class IntrospectorHelper(object):
         Strips the params from the docstring (ie. myparam -- Some param) will
         not be removed from the text body
         """
-        split_lines = trim_docstring(docstring).split('\n')
+        stripped = _stripped_docstring_cache.get(docstring)
+        if stripped is None:
+            stripped = IntrospectorHelper._strip_params_from_docstring(docstring)
+            _stripped_docstring_cache[docstring] = stripped
+
+        return stripped
 
-        cut_off = None
-        for index, line in enumerate(split_lines):
-            line = line.strip()
-            if line.find('--') != -1:
-                cut_off = index
-                break
-        if cut_off is not None:
-            split_lines = split_lines[0:cut_off]
+    @staticmethod
+    def _strip_params_from_docstring(docstring):
+        docstring = trim_docstring(docstring)
+
+        match = _param_line_re.search(docstring)
+        if match is not None:
+            # Cut before the newline that precedes the parameter line
+            docstring = docstring[:max(match.start() - 1, 0)]
 
-        return "<br/>".join(split_lines)
+        return docstring.replace('\n', "<br/>")
 
     @staticmethod
     def get_serializer_name(serializer):
@@ -36,22 +68,42 @@ class IntrospectorHelper(object):
 
         return serializer.__name__
 
+    @staticmethod
+    def get_serializer_fields(serializer):
+        """
+        Returns the fields of a serializer class. The result is shared between
+        callers and must be treated as read-only.
+        """
+        fields = _serializer_fields_cache.get(serializer)
+        if fields is None:
+            fields = serializer().get_fields()
+            _serializer_fields_cache[serializer] = fields
+
+        return fields
 
     @staticmethod
     def get_view_description(callback):
         """
         Returns the first sentence of the first line of the class docstring
         """
-        return get_view_description(callback).split("\n")[0].split(".")[0]
+        description = _view_description_cache.get(callback)
+        if description is None:
+            description = get_view_description(callback).partition("\n")[0].partition(".")[0]
+            _view_description_cache[callback] = description
+
+        return description
 
 
 class BaseViewIntrospector(object):
     __metaclass__ = ABCMeta
+    __slots__ = ('callback', 'path', 'pattern', 'docstring', 'serializer_class')
 
     def __init__(self, callback, path, pattern):
         self.callback = callback
         self.path = path
         self.pattern = pattern
+        self.docstring = None
+        self.serializer_class = _unset
 
     @abstractmethod
     def __iter__(self):
@@ -61,8 +113,26 @@ class BaseViewIntrospector(object):
         return self.__iter__()
 
     def get_serializer_class(self):
-        if hasattr(self.callback, 'get_serializer_class'):
-            return self.callback().get_serializer_class()
+        """
+        Returns the view's serializer class. Resolving it instantiates the
+        view, so it is only done once for all of the view's methods.
+        """
+        if self.serializer_class is _unset:
+            self.serializer_class = None
+            if hasattr(self.callback, 'get_serializer_class'):
+                self.serializer_class = self.callback().get_serializer_class()
+
+        return self.serializer_class
+
+    def get_docstring(self):
+        """
+        Returns the class docstring. It is shared by every method of the view
+        so it is only retrieved once.
+        """
+        if self.docstring is None:
+            self.docstring = get_view_description(self.callback)
+
+        return self.docstring
 
     def get_description(self):
         """
@@ -73,6 +143,7 @@ class BaseViewIntrospector(object):
 
 class BaseMethodIntrospector(object):
     __metaclass__ = ABCMeta
+    __slots__ = ('method', 'parent', 'callback', 'path')
 
     def __init__(self, view_introspector, method):
         self.method = method
@@ -89,7 +160,7 @@ class BaseMethodIntrospector(object):
         # If there is no docstring on the method, get class docs
         if docs is None:
             docs = self.parent.get_description()
-        docs = trim_docstring(docs).split('\n')[0]
+        docs = trim_docstring(docs).partition('\n')[0]
 
         return docs
 
@@ -103,20 +174,13 @@ class BaseMethodIntrospector(object):
         listed. First, get the class docstring and then get the method's. The
         methods will always inherit the class comments.
         """
-        docstring = ""
+        docs = [trim_docstring(self.parent.get_docstring())]
 
-        class_docs = trim_docstring(get_view_description(self.callback))
         method_docs = self.get_docs()
+        if method_docs:
+            docs.append(method_docs)
 
-        if class_docs is not None:
-            docstring += class_docs
-        if method_docs is not None:
-            docstring += '\n' + method_docs
-
-        docstring = IntrospectorHelper.strip_params_from_docstring(docstring)
-        docstring = docstring.replace("\n\n", "<br/>")
-
-        return docstring
+        return IntrospectorHelper.strip_params_from_docstring('\n'.join(docs))
 
     def get_parameters(self):
         """
@@ -124,23 +188,19 @@ class BaseMethodIntrospector(object):
         query parameters as well as HTTP body parameters that are defined by
         the DRF serializer fields
         """
-        params = []
-        path_params = self.build_path_parameters()
-        body_params = self.build_body_parameters()
-        form_params = self.build_form_parameters()
-        query_params = self.build_query_params_from_docstring()
-
-        if path_params:
-            params += path_params
+        http_method = self.get_http_method()
+        params = self.build_path_parameters()
 
-        if self.get_http_method() not in ["GET", "DELETE"]:
-            params += form_params
+        if http_method not in _bodyless_methods:
+            form_params = self.build_form_parameters()
+            params.extend(form_params)
 
-            if not form_params and body_params is not None:
-                params.append(body_params)
+            if not form_params:
+                body_params = self.build_body_parameters()
+                if body_params is not None:
+                    params.append(body_params)
 
-        if query_params:
-            params += query_params
+        params.extend(self.build_query_params_from_docstring())
 
         return params
 
@@ -156,10 +216,10 @@ class BaseMethodIntrospector(object):
         Attempts to fetch the docs for a class method. Returns None
         if the method does not exist
         """
-        method = str(self.method).lower()
-        if not hasattr(self.callback, method):
+        method = getattr(self.callback, str(self.method).lower(), None)
+        if method is None:
             return None
-        return getattr(self.callback, method).__doc__
+        return method.__doc__
 
     def build_body_parameters(self):
         serializer = self.get_serializer_class()
@@ -178,18 +238,12 @@ class BaseMethodIntrospector(object):
         """
         Gets the parameters from the URL
         """
-        url_params = re.findall('/{([^}]*)}', self.path)
-        params = []
-
-        for param in url_params:
-            params.append({
-                'name': param,
-                'dataType': 'string',
-                'paramType': 'path',
-                'required': True
-            })
-
-        return params
+        return [{
+            'name': param,
+            'dataType': 'string',
+            'paramType': 'path',
+            'required': True
+        } for param in _path_param_re.findall(self.path)]
 
     def build_form_parameters(self):
         """
@@ -201,60 +255,59 @@ class BaseMethodIntrospector(object):
         if serializer is None:
             return data
 
-        fields = serializer().get_fields()
+        fields = IntrospectorHelper.get_serializer_fields(serializer)
 
         for name, field in fields.items():
 
             if getattr(field, 'read_only', False):
                 continue
 
-            data_type = field.type_label
+            param = {
+                'paramType': 'form',
+                'name': name,
+                'dataType': field.type_label,
+                'description': getattr(field, 'help_text', ''),
+            }
+
             max_length = getattr(field, 'max_length', None)
             min_length = getattr(field, 'min_length', None)
-            allowable_values = None
-
             if max_length is not None or min_length is not None:
-                allowable_values = {
+                param['allowableValues'] = {
                     'max': max_length,
                     'min': min_length,
                     'valueType': 'RANGE'
                 }
 
-            data.append({
-                'paramType': 'form',
-                'name': name,
-                'dataType': data_type,
-                'allowableValues': allowable_values,
-                'description': getattr(field, 'help_text', ''),
-                'defaultValue': getattr(field, 'default', None),
-                'required': getattr(field, 'required', None)
-            })
+            default = getattr(field, 'default', None)
+            if default is not None:
+                param['defaultValue'] = default
+
+            required = getattr(field, 'required', None)
+            if required is not None:
+                param['required'] = required
+
+            data.append(param)
 
         return data
 
     def build_query_params_from_docstring(self):
         params = []
 
-        docstring = self.retrieve_docstring() if None else ''
-        docstring += "\n" + get_view_description(self.callback)
-
-        if docstring is None:
-            return params
+        docstring = self.retrieve_docstring() or ''
+        docstring += "\n" + self.parent.get_docstring()
 
-        split_lines = docstring.split('\n')
-
-        for line in split_lines:
-            param = line.split(' -- ')
-            if len(param) == 2:
-                params.append({'paramType': 'query',
-                               'name': param[0].strip(),
-                               'description': param[1].strip(),
-                               'dataType': ''})
+        for match in _query_param_re.finditer(docstring):
+            params.append({'paramType': 'query',
+                           'name': match.group(1).strip(),
+                           'description': match.group(2).strip(),
+                           'dataType': ''})
 
         return params
 
 
 class APIViewIntrospector(BaseViewIntrospector):
+    __slots__ = ()
+
     def __iter__(self):
         methods = self.callback().allowed_methods
         for method in methods:
@@ -262,6 +315,8 @@ class APIViewIntrospector(BaseViewIntrospector):
 
 
 class APIViewMethodIntrospector(BaseMethodIntrospector):
+    __slots__ = ()
+
     def get_docs(self):
         """
         Attempts to retrieve method specific docs for an
@@ -273,24 +328,24 @@ class APIViewMethodIntrospector(BaseMethodIntrospector):
 
 class ViewSetIntrospector(BaseViewIntrospector):
     """Handle ViewSet introspection."""
+    __slots__ = ()
 
     def __iter__(self):
-        methods = self._resolve_methods()
-        for method in methods:
-            yield ViewSetMethodIntrospector(self, methods[method], method)
+        for http_method, method in self._resolve_methods().items():
+            yield ViewSetMethodIntrospector(self, method, http_method)
 
     def _resolve_methods(self):
-        if not hasattr(self.pattern.callback, 'func_code') or \
-                not hasattr(self.pattern.callback, 'func_closure') or \
-                not hasattr(self.pattern.callback.func_code, 'co_freevars') or \
-                'actions' not in self.pattern.callback.func_code.co_freevars:
+        callback = self.pattern.callback
+        try:
+            idx = callback.__code__.co_freevars.index('actions')
+            return callback.__closure__[idx].cell_contents
+        except (AttributeError, ValueError):
             raise RuntimeError('Unable to use callback invalid closure/function specified.')
 
-        idx = self.pattern.callback.func_code.co_freevars.index('actions')
-        return self.pattern.callback.func_closure[idx].cell_contents
-
 
 class ViewSetMethodIntrospector(BaseMethodIntrospector):
+    __slots__ = ('http_method',)
+
     def __init__(self, view_introspector, method, http_method):
         super(ViewSetMethodIntrospector, self).__init__(view_introspector, method)
         self.http_method = http_method.upper()
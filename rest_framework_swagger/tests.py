@@ -1,3 +1,7 @@
+import sys
+import types
+from importlib import import_module
+
 from django.core.urlresolvers import RegexURLResolver
 
 from django.conf import settings
@@ -6,7 +10,8 @@ from django.contrib.auth.models import User
 from django.contrib.admindocs.utils import trim_docstring
 from django.http import HttpRequest
 from django.test import TestCase
-from django.utils.importlib import import_module
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
 from django.views.generic import View
 
 from rest_framework.views import APIView
@@ -15,6 +20,7 @@ from rest_framework import serializers
 from rest_framework.routers import DefaultRouter
 from rest_framework.viewsets import ModelViewSet
 
+from . import views
 from .urlparser import UrlParser
 from .docgenerator import DocumentationGenerator
 from .introspectors import ViewSetIntrospector, APIViewIntrospector, IntrospectorHelper, APIViewMethodIntrospector
@@ -44,19 +50,29 @@ class CommentSerializer(serializers.Serializer):
     created = serializers.DateTimeField()
 
 
+MOCK_API_VIEW = MockApiView.as_view()
+
+EMPTY_PATTERNS = patterns('')
+
+URL_PATTERNS = patterns('',
+    url(r'a-view/?$', MOCK_API_VIEW, name='a test view'),
+    url(r'a-view/child/?$', MOCK_API_VIEW),
+    url(r'a-view/child2/?$', MOCK_API_VIEW),
+    url(r'another-view/?$', MOCK_API_VIEW, name='another test view'),
+)
+
+# Lets the view tests use this module as ROOT_URLCONF
+urlpatterns = URL_PATTERNS
+
+
 class UrlParserTest(TestCase):
-    def setUp(self):
-        self.url_patterns = patterns('',
-            url(r'a-view/?$', MockApiView.as_view(), name='a test view'),
-            url(r'a-view/child/?$', MockApiView.as_view()),
-            url(r'a-view/child2/?$', MockApiView.as_view()),
-            url(r'another-view/?$', MockApiView.as_view(), name='another test view'),
-        )
+    url_patterns = URL_PATTERNS
 
     def test_get_apis(self):
         urlparser = UrlParser()
         urls = import_module(settings.ROOT_URLCONF)
         # Overwrite settings with test patterns
+        self.addCleanup(setattr, urls, 'urlpatterns', urls.urlpatterns)
         urls.urlpatterns = self.url_patterns
         apis = urlparser.get_apis()
 
@@ -113,8 +129,14 @@ class UrlParserTest(TestCase):
         urlparser = UrlParser()
         apis = urlparser.get_apis(urls)
 
-        self.assertEqual(sum(api['path'].find('api') != -1 for api in apis), 4)
-        self.assertEqual(sum(api['path'].find('test') != -1 for api in apis), 4)
+        api_count = test_count = 0
+        for api in apis:
+            path = api['path']
+            api_count += 'api' in path
+            test_count += 'test' in path
+
+        self.assertEqual(api_count, 4)
+        self.assertEqual(test_count, 4)
 
     def test_get_api_callback(self):
         urlparser = UrlParser()
@@ -175,7 +197,10 @@ class UrlParserTest(TestCase):
 
 
 class NestedUrlParserTest(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        super(NestedUrlParserTest, cls).setUpClass()
+
         class FuzzyApiView(APIView):
             def get(self, request):
                 pass
@@ -196,7 +221,7 @@ class NestedUrlParserTest(TestCase):
             '', url(r'^api/', include(api_shiny_url_patterns,
                                       namespace='api_shiny_app')))
 
-        self.project_urls = patterns(
+        cls.project_urls = patterns(
             '',
             url('my_fuzzy_app/', include(fuzzy_app_urls)),
             url('my_shiny_app/', include(shiny_app_urls)),
@@ -214,14 +239,6 @@ class NestedUrlParserTest(TestCase):
 
 
 class DocumentationGeneratorTest(TestCase):
-    def setUp(self):
-        self.url_patterns = patterns('',
-            url(r'a-view/?$', MockApiView.as_view(), name='a test view'),
-            url(r'a-view/child/?$', MockApiView.as_view()),
-            url(r'a-view/<pk>/?$', MockApiView.as_view(), name="detailed view for mock"),
-            url(r'another-view/?$', MockApiView.as_view(), name='another test view'),
-        )
-
     def test_get_operations(self):
 
         class AnAPIView(APIView):
@@ -231,7 +248,7 @@ class DocumentationGeneratorTest(TestCase):
         api = {
             'path': 'a-path/',
             'callback': AnAPIView,
-            'pattern': patterns('')
+            'pattern': EMPTY_PATTERNS
         }
         docgen = DocumentationGenerator()
         operations = docgen.get_operations(api)
@@ -246,7 +263,7 @@ class DocumentationGeneratorTest(TestCase):
         api = {
             'path': 'a-path/',
             'callback': AnAPIView,
-            'pattern': patterns('')
+            'pattern': EMPTY_PATTERNS
         }
         docgen = DocumentationGenerator()
         operations = docgen.get_operations(api)
@@ -285,6 +302,13 @@ class DocumentationGeneratorTest(TestCase):
 
         self.assertEqual(3, len(fields))
 
+    def test_get_serializer_fields_allowable_values(self):
+        docgen = DocumentationGenerator()
+        fields = docgen._get_serializer_fields(CommentSerializer)
+
+        self.assertEqual(200, fields['content']['allowableValues']['max'])
+        self.assertNotIn('allowableValues', fields['created'])
+
     def test_get_serializer_fields_api_with_no_serializer(self):
         docgen = DocumentationGenerator()
         fields = docgen._get_serializer_fields(None)
@@ -341,6 +365,12 @@ class IntrospectorHelperTest(TestCase):
 
         self.assertEqual(expected, docstring)
 
+    def test_get_serializer_fields_is_cached(self):
+        fields = IntrospectorHelper.get_serializer_fields(CommentSerializer)
+
+        self.assertEqual(3, len(fields))
+        self.assertIs(fields, IntrospectorHelper.get_serializer_fields(CommentSerializer))
+
 
 class ViewSetTestIntrospectorTest(TestCase):
     def test_get_allowed_methods(self):
@@ -472,4 +502,131 @@ class BaseMethodIntrospectorTest(TestCase):
         self.assertEqual(True, param['required'])
         self.assertEqual(200, param['allowableValues']['max'])
         self.assertEqual(10, param['allowableValues']['min'])
-        self.assertEqual('Vandalay Industries', param['defaultValue'])
\ No newline at end of file
+        self.assertEqual('Vandalay Industries', param['defaultValue'])
+
+    def test_build_query_params_from_docstring(self):
+        class MyApiView(APIView):
+            """
+            My comments are here
+
+            email -- e-mail address
+            range -- start -- end
+            """
+            def get(self, request):
+                pass
+
+        class_introspector = APIViewIntrospector(MyApiView, '/', RegexURLResolver(r'^/$', ''))
+        introspector = APIViewMethodIntrospector(class_introspector, 'GET')
+        params = introspector.build_query_params_from_docstring()
+
+        self.assertEqual(2, len(params))
+        self.assertEqual('email', params[0]['name'])
+        self.assertEqual('e-mail address', params[0]['description'])
+        self.assertEqual('query', params[0]['paramType'])
+        self.assertEqual('range', params[1]['name'])
+        self.assertEqual('start -- end', params[1]['description'])
+
+    def test_build_query_params_from_method_docstring(self):
+        class MyApiView(APIView):
+            """
+            My comments are here
+            """
+            def get(self, request):
+                """
+                page -- page number
+                """
+                pass
+
+        class_introspector = APIViewIntrospector(MyApiView, '/', RegexURLResolver(r'^/$', ''))
+        introspector = APIViewMethodIntrospector(class_introspector, 'GET')
+        params = introspector.build_query_params_from_docstring()
+
+        self.assertEqual(1, len(params))
+        self.assertEqual('page', params[0]['name'])
+
+
+@override_settings(ROOT_URLCONF='rest_framework_swagger.tests', ALLOWED_HOSTS=['*'])
+class ViewsApiCacheTest(TestCase):
+    def test_get_apis_caches_advertised_resources(self):
+        apis = views.get_apis(filter_path='a-view')
+
+        self.assertIn((settings.ROOT_URLCONF, (), 'a-view'), views._apis_cache)
+        self.assertIs(apis, views.get_apis(filter_path='a-view'))
+
+    def test_get_apis_does_not_cache_unknown_paths(self):
+        views.get_apis(exclude_namespaces=views.SWAGGER_SETTINGS['exclude_namespaces'])
+        cached = dict(views._apis_cache)
+
+        views.get_apis(filter_path='unknown-view')
+
+        self.assertEqual(cached, views._apis_cache)
+
+    def test_get_top_level_apis_is_cached(self):
+        resources = views.get_top_level_apis()
+
+        self.assertIn('a-view', resources)
+        self.assertIs(resources, views.get_top_level_apis())
+
+
+@override_settings(ROOT_URLCONF='rest_framework_swagger.tests', ALLOWED_HOSTS=['*'])
+class SwaggerApiViewDocumentationTest(TestCase):
+    def get_documentation(self, path, **extra):
+        request = RequestFactory().get('/api-docs/' + path, **extra)
+        return views.SwaggerApiView.as_view()(request, path=path)
+
+    def get_http_methods(self, path):
+        response = self.get_documentation(path)
+        return sorted(
+            operation['httpMethod']
+            for api in response.data['apis']
+            for operation in api['operations']
+        )
+
+    def make_urlconf(self, name, *urls):
+        module = types.ModuleType(name)
+        module.urlpatterns = patterns('', *urls)
+        sys.modules[name] = module
+        self.addCleanup(sys.modules.pop, name)
+        return name
+
+    def test_documentation_is_cached_for_resources(self):
+        first = self.get_documentation('a-view')
+        second = self.get_documentation('a-view')
+
+        self.assertIn((settings.ROOT_URLCONF, 'a-view'), views._documentation_cache)
+        self.assertIs(first.data['apis'], second.data['apis'])
+        self.assertIs(first.data['models'], second.data['models'])
+
+    def test_documentation_is_not_cached_for_unknown_paths(self):
+        response = self.get_documentation('unknown-view')
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({}, views._documentation_cache)
+
+    def test_base_path_is_not_cached(self):
+        first = self.get_documentation('a-view', HTTP_HOST='first.example.com')
+        second = self.get_documentation('a-view', HTTP_HOST='second.example.com')
+
+        self.assertIn('first.example.com', first.data['basePath'])
+        self.assertIn('second.example.com', second.data['basePath'])
+        self.assertNotIn('basePath', views._documentation_cache[(settings.ROOT_URLCONF, 'a-view')])
+
+    def test_urlconf_change_regenerates_documentation(self):
+        class CommentViewSet(ModelViewSet):
+            serializer_class = CommentSerializer
+            model = User
+
+        read_write_urls = self.make_urlconf(
+            'rest_framework_swagger.tests_read_write_urls',
+            url(r'^comments/?$', CommentViewSet.as_view({'get': 'list', 'post': 'create'})),
+        )
+        read_only_urls = self.make_urlconf(
+            'rest_framework_swagger.tests_read_only_urls',
+            url(r'^comments/?$', CommentViewSet.as_view({'get': 'list'})),
+        )
+
+        with override_settings(ROOT_URLCONF=read_write_urls):
+            self.assertEqual(['GET', 'POST'], self.get_http_methods('comments'))
+
+        with override_settings(ROOT_URLCONF=read_only_urls):
+            self.assertEqual(['GET'], self.get_http_methods('comments'))
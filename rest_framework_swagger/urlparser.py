@@ -1,13 +1,17 @@
+from collections import deque
+from importlib import import_module
+
 from django.conf import settings
-from django.utils.importlib import import_module
 from django.core.urlresolvers import RegexURLResolver, RegexURLPattern
 from django.contrib.admindocs.views import simplify_regex
+from django.utils import six
 from rest_framework.views import APIView
 
 from rest_framework_swagger.apidocview import APIDocView
 
 
 class UrlParser(object):
+    __slots__ = ()
 
     def get_apis(self, patterns=None, filter_path=None, exclude_namespaces=[]):
         """
@@ -60,7 +64,7 @@ class UrlParser(object):
         apis -- list of APIs as returned by self.get_apis
         """
         root_paths = set()
-        api_paths = [endpoint['path'].strip("/") for endpoint in apis]
+        api_paths = set(endpoint['path'].strip("/") for endpoint in apis)
 
         for path in api_paths:
             #  If a URLs /resource/ and /resource/{pk} exist, use the base
@@ -103,16 +107,23 @@ class UrlParser(object):
 
     def __flatten_patterns_tree__(self, patterns, prefix='', filter_path=None, exclude_namespaces=[]):
         """
-        Uses recursion to flatten url tree.
+        Flattens the url tree depth first, keeping the order of the patterns.
 
         patterns -- urlpatterns list
         prefix -- (optional) Prefix for URL pattern
         """
+        if isinstance(exclude_namespaces, six.string_types):
+            exclude_namespaces = [exclude_namespaces]
+        exclude_namespaces = frozenset(exclude_namespaces or ())
+
         pattern_list = []
+        pending = deque((prefix, pattern) for pattern in patterns)
+
+        while pending:
+            pattern_prefix, pattern = pending.popleft()
 
-        for pattern in patterns:
             if isinstance(pattern, RegexURLPattern):
-                endpoint_data = self.__assemble_endpoint_data__(pattern, prefix, filter_path=filter_path)
+                endpoint_data = self.__assemble_endpoint_data__(pattern, pattern_prefix, filter_path=filter_path)
 
                 if endpoint_data is None:
                     continue
@@ -124,13 +135,8 @@ class UrlParser(object):
                 if pattern.namespace in exclude_namespaces:
                     continue
 
-                pref = prefix + pattern.regex.pattern
-                pattern_list.extend(self.__flatten_patterns_tree__(
-                    pattern.url_patterns,
-                    pref,
-                    filter_path=filter_path,
-                    exclude_namespaces=exclude_namespaces,
-                ))
+                pref = pattern_prefix + pattern.regex.pattern
+                pending.extendleft(reversed([(pref, child) for child in pattern.url_patterns]))
 
         return pattern_list
 
@@ -139,20 +145,23 @@ class UrlParser(object):
         Verifies that pattern callback is a subclass of APIView, and returns the class
         Handles older django & django rest 'cls_instance'
         """
-        if not hasattr(pattern, 'callback'):
+        callback = getattr(pattern, 'callback', None)
+        if callback is None:
             return
 
-        if (hasattr(pattern.callback, 'cls') and
-                issubclass(pattern.callback.cls, APIView) and
-                not issubclass(pattern.callback.cls, APIDocView)):
+        cls = getattr(callback, 'cls', None)
+        if (cls is not None and
+                issubclass(cls, APIView) and
+                not issubclass(cls, APIDocView)):
 
-            return pattern.callback.cls
+            return cls
 
-        elif (hasattr(pattern.callback, 'cls_instance') and
-                isinstance(pattern.callback.cls_instance, APIView) and
-                not issubclass(pattern.callback.cls_instance, APIDocView)):
+        cls_instance = getattr(callback, 'cls_instance', None)
+        if (cls_instance is not None and
+                isinstance(cls_instance, APIView) and
+                not issubclass(cls_instance, APIDocView)):
 
-            return pattern.callback.cls_instance
+            return cls_instance
 
     def __exclude_router_api_root__(self, callback):
         """
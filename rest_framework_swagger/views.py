@@ -1,40 +1,102 @@
+from django.conf import settings
 from django.views.generic import View
 from django.utils.safestring import mark_safe
-from django.shortcuts import render_to_response, RequestContext
+from django.template.response import TemplateResponse
 from django.core.exceptions import PermissionDenied
+from django.dispatch import receiver
+try:
+    from django.core.signals import setting_changed
+except ImportError:
+    from django.test.signals import setting_changed
 
 from rest_framework.views import Response
 from rest_framework_swagger.urlparser import UrlParser
 from rest_framework_swagger.apidocview import APIDocView
-from rest_framework_swagger.docgenerator import DocumentationGenerator
 
 from rest_framework_swagger import SWAGGER_SETTINGS
 
 
+# Parsed APIs keyed by (urlconf, excluded namespaces, filter path). Walking
+# the URL tree is the bulk of every documentation request and the patterns
+# do not change once the URLconf is loaded. Filter paths come from the
+# request, so only those naming a known resource are cached.
+_apis_cache = {}
+
+# Top level APIs (resources) keyed by (urlconf, excluded namespaces)
+_resources_cache = {}
+
+# Generated resource documentation keyed by (urlconf, resource path)
+_documentation_cache = {}
+
+
+def get_apis(filter_path=None, exclude_namespaces=()):
+    key = (settings.ROOT_URLCONF, tuple(exclude_namespaces), filter_path)
+    apis = _apis_cache.get(key)
+    if apis is None:
+        apis = UrlParser().get_apis(
+            filter_path=filter_path,
+            exclude_namespaces=exclude_namespaces,
+        )
+        if filter_path is None or filter_path in get_top_level_apis(
+                SWAGGER_SETTINGS['exclude_namespaces']):
+            _apis_cache[key] = apis
+
+    return apis
+
+
+def get_top_level_apis(exclude_namespaces=()):
+    key = (settings.ROOT_URLCONF, tuple(exclude_namespaces))
+    resources = _resources_cache.get(key)
+    if resources is None:
+        apis = get_apis(exclude_namespaces=exclude_namespaces)
+        resources = UrlParser().get_top_level_apis(apis)
+        _resources_cache[key] = resources
+
+    return resources
+
+
+@receiver(setting_changed)
+def clear_apis_cache(sender, setting, **kwargs):
+    if setting == 'ROOT_URLCONF':
+        _apis_cache.clear()
+        _resources_cache.clear()
+        _documentation_cache.clear()
+
+
+# Resource listing fields that do not depend on the request
+_resource_listing = {
+    'apiVersion': SWAGGER_SETTINGS['api_version'],
+    'swaggerVersion': '1.2',
+}
+
+# Swagger UI settings that do not depend on the request
+_ui_settings = {
+    'api_key': SWAGGER_SETTINGS['api_key'],
+    'enabled_methods': mark_safe(SWAGGER_SETTINGS['enabled_methods']),
+}
+
+
 class SwaggerUIView(View):
+    template_name = "rest_framework_swagger/index.html"
 
     def get(self, request, *args, **kwargs):
 
         if not self.has_permission(request):
             raise PermissionDenied()
 
-        template_name = "rest_framework_swagger/index.html"
+        swagger_settings = dict(_ui_settings)
+        swagger_settings['discovery_url'] = "%sapi-docs/" % request.build_absolute_uri()
         data = {
-            'swagger_settings': {
-                'discovery_url': "%sapi-docs/" % request.build_absolute_uri(),
-                'api_key': SWAGGER_SETTINGS.get('api_key', ''),
-                'enabled_methods': mark_safe(SWAGGER_SETTINGS.get('enabled_methods'))
-            }
+            'swagger_settings': swagger_settings
         }
-        response = render_to_response(template_name, RequestContext(request, data))
 
-        return response
+        return TemplateResponse(request, self.template_name, data)
 
     def has_permission(self, request):
-        if SWAGGER_SETTINGS.get('is_superuser') and not request.user.is_superuser:
+        if SWAGGER_SETTINGS['is_superuser'] and not request.user.is_superuser:
             return False
 
-        if SWAGGER_SETTINGS.get('is_authenticated') and not request.user.is_authenticated():
+        if SWAGGER_SETTINGS['is_authenticated'] and not request.user.is_authenticated():
             return False
 
         return True
@@ -43,39 +105,48 @@ class SwaggerUIView(View):
 class SwaggerResourcesView(APIDocView):
 
     def get(self, request):
-        apis = []
-        resources = self.get_resources()
+        data = dict(_resource_listing)
+        data['basePath'] = self.host.rstrip('/')
+        data['apis'] = [{'path': "/%s" % path} for path in self.get_resources()]
 
-        for path in resources:
-            apis.append({
-                'path': "/%s" % path,
-            })
-
-        return Response({
-            'apiVersion': SWAGGER_SETTINGS.get('api_version', ''),
-            'swaggerVersion': '1.2',
-            'basePath': self.host.rstrip('/'),
-            'apis': apis
-        })
+        return Response(data)
 
     def get_resources(self):
-        urlparser = UrlParser()
-        apis = urlparser.get_apis(exclude_namespaces=SWAGGER_SETTINGS.get('exclude_namespaces'))
-        return urlparser.get_top_level_apis(apis)
+        return get_top_level_apis(exclude_namespaces=SWAGGER_SETTINGS['exclude_namespaces'])
 
 
 class SwaggerApiView(APIDocView):
 
     def get(self, request, path):
+        data = dict(self.get_documentation(path))
+        data['basePath'] = self.api_full_uri.rstrip('/')
+
+        return Response(data)
+
+    def get_documentation(self, path):
+        """
+        Returns the apis and models of a resource. The documentation of
+        advertised resources is only generated once.
+        """
+        key = (settings.ROOT_URLCONF, path)
+        documentation = _documentation_cache.get(key)
+        if documentation is not None:
+            return documentation
+
+        # Only resource pages need the introspection machinery
+        from rest_framework_swagger.docgenerator import DocumentationGenerator
+
         apis = self.get_api_for_resource(path)
         generator = DocumentationGenerator()
-
-        return Response({
+        documentation = {
             'apis': generator.generate(apis),
             'models': generator.get_models(apis),
-            'basePath': self.api_full_uri.rstrip('/'),
-        })
+        }
+
+        if path in get_top_level_apis(SWAGGER_SETTINGS['exclude_namespaces']):
+            _documentation_cache[key] = documentation
+
+        return documentation
 
     def get_api_for_resource(self, filter_path):
-        urlparser = UrlParser()
-        return urlparser.get_apis(filter_path=filter_path)
+        return get_apis(filter_path=filter_path)